@@ -3,10 +3,7 @@ import sys
 from types import ModuleType
 from typing import Any, Callable, Collection, Dict, List, Optional, Tuple, Type, Union
 
-_sys_version_info = sys.version_info
-_version_tuple = (_sys_version_info.major, _sys_version_info.minor, _sys_version_info.micro)
-
-if _version_tuple < (3, 11, 0):
+if sys.version_info < (3, 11):
     from typing_extensions import NotRequired
 else:
     from typing import NotRequired
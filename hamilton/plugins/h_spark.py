@@ -3,7 +3,19 @@ import inspect
 import logging
 import sys
 from types import CodeType, FunctionType, ModuleType
-from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -558,11 +570,19 @@ def sparkify_node_with_udf(
 
     """
 
+    # Computed once here so each call does a single set lookup per kwarg
+    kwargs_to_ignore = frozenset(
+        {
+            *dependent_columns_from_dataframe,
+            *dependent_columns_in_group,
+            linear_df_dependency_name,
+            base_df_dependency_name,
+        }
+    )
+
     def new_callable(
         __linear_df_dependency_name: str = linear_df_dependency_name,
-        __base_df_dependency_name: str = base_df_dependency_name,
-        __dependent_columns_in_group: Set[str] = dependent_columns_in_group,
-        __dependent_columns_from_dataframe: Set[str] = dependent_columns_from_dataframe,
+        __kwargs_to_ignore: FrozenSet[str] = kwargs_to_ignore,
         __base_df_dependency_param: str = base_df_dependency_param,
         __node: node.Node = node_,
         **kwargs,
@@ -572,15 +592,8 @@ def sparkify_node_with_udf(
         ignoring the rest."""
         # gather the dataframe from the kwargs
         df = kwargs[__linear_df_dependency_name]
-        kwargs = {
-            k: v
-            for k, v in kwargs.items()
-            if k not in __dependent_columns_from_dataframe
-            and k not in __dependent_columns_in_group
-            and k != __linear_df_dependency_name
-            and k != __base_df_dependency_name
-        }
-        return _lambda_udf(df, node_, kwargs)
+        kwargs = {k: v for k, v in kwargs.items() if k not in __kwargs_to_ignore}
+        return _lambda_udf(df, __node, kwargs)
 
     # Just extract the dependeency type
     # TODO -- add something as a "logical" or "placeholder" dependency
@@ -871,9 +884,14 @@ class require_columns(fm_base.NodeTransformer):
         # These are the linear_df_dependency_name (the dataframe that is being modified)
         # as well as any non-dataframe arguments (E.G. the ones that aren't about to be added
         # Note that the node comes with logical dependencies already, so we filter them out
-        def new_callable(__callable=node_.callable, **kwargs) -> Any:
+        def new_callable(
+            __callable=node_.callable,
+            __transformation_target=transformation_target,
+            __linear_df_dependency_name=linear_df_dependency_name,
+            **kwargs,
+        ) -> Any:
             new_kwargs = kwargs.copy()
-            new_kwargs[transformation_target] = kwargs[linear_df_dependency_name]
+            new_kwargs[__transformation_target] = kwargs[__linear_df_dependency_name]
             return __callable(**new_kwargs)
 
         # We start off with everything except the transformation target, as we're
@@ -890,8 +908,11 @@ class require_columns(fm_base.NodeTransformer):
         )
         # Then we go through all "logical" dependencies -- columns we want to add to make lineage
         # look nice
-        for item in dependent_columns_from_upstream:
-            new_input_types[item] = (DataFrame, node.DependencyType.REQUIRED)
+        new_input_types.update(
+            dict.fromkeys(
+                dependent_columns_from_upstream, (DataFrame, node.DependencyType.REQUIRED)
+            )
+        )
 
         # Then we see if we're trying to transform the base dataframe
         # This means we're not referring to it as a column, and only happens with the
@@ -1024,6 +1045,7 @@ class with_columns(fm_base.NodeCreator):
         """
         self.subdag_functions = subdag.collect_functions(load_from)
         self.select = select
+        # Kept for compatibility only -- internally we use _initial_schema_set
         self.initial_schema = columns_to_pass
         if (pass_dataframe_as is not None and columns_to_pass is not None) or (
             pass_dataframe_as is None and columns_to_pass is None
@@ -1041,11 +1063,18 @@ class with_columns(fm_base.NodeCreator):
                 "us which parameters to take from that dataframe, so we can"
                 "feed the right data into the right columns."
             )
+        # Computed once as it is checked against every node on each build
+        self._initial_schema_set = frozenset(columns_to_pass or ())
         self.dataframe_subdag_param = pass_dataframe_as
         self.namespace = namespace
         self.upstream_dependency = dataframe
         self.mode = mode
         self.config_required = config_required
+        # When config_required is set, subdag nodes only depend on those config items,
+        # so we cache them per (key, type, value) combination of that filtered config
+        self._sorted_nodes_cache: Dict[FrozenSet[Tuple[str, Type, Any]], List[node.Node]] = {}
+        # validate and generate_nodes both need this for the same function, so we store it
+        self._inject_parameters: Dict[Callable, str] = {}
 
     @staticmethod
     def _prep_nodes(initial_nodes: List[node.Node]) -> List[node.Node]:
@@ -1079,8 +1108,10 @@ class with_columns(fm_base.NodeCreator):
         :return:
         """
 
-        def new_callable(**kwargs) -> DataFrame:
-            return kwargs[upstream_name].select(*columns)
+        def new_callable(
+            __upstream_name=upstream_name, __columns=tuple(columns), **kwargs
+        ) -> DataFrame:
+            return kwargs[__upstream_name].select(*__columns)
 
         return node.Node(
             name=node_name,
@@ -1102,8 +1133,10 @@ class with_columns(fm_base.NodeCreator):
         :return:
         """
 
-        def new_callable(**kwargs) -> DataFrame:
-            return kwargs[upstream_name].drop(*columns)
+        def new_callable(
+            __upstream_name=upstream_name, __columns=tuple(columns), **kwargs
+        ) -> DataFrame:
+            return kwargs[__upstream_name].drop(*__columns)
 
         return node.Node(
             name=node_name,
@@ -1114,8 +1147,9 @@ class with_columns(fm_base.NodeCreator):
 
     def _validate_dataframe_subdag_parameter(self, nodes: List[node.Node], fn_name: str):
         all_upstream_dataframe_nodes = _identify_upstream_dataframe_nodes(nodes)
-        initial_schema = set(self.initial_schema) if self.initial_schema is not None else set()
-        candidates_for_upstream_dataframe = set(all_upstream_dataframe_nodes) - set(initial_schema)
+        candidates_for_upstream_dataframe = (
+            set(all_upstream_dataframe_nodes) - self._initial_schema_set
+        )
         if (
             len(candidates_for_upstream_dataframe) > 1
             or self.dataframe_subdag_param is None
@@ -1149,6 +1183,41 @@ class with_columns(fm_base.NodeCreator):
     def required_config(self) -> List[str]:
         return self.config_required
 
+    def _resolve_sorted_nodes(self, fn: Callable, config: Dict[str, Any]) -> List[node.Node]:
+        """Collects the nodes from the subdag functions, prunes them to the ones upstream
+        of the select columns, and sorts them topologically.
+
+        If `config_required` is specified, the config we receive is filtered down to just those
+        keys, so we cache the result per config, keyed on the type as well as the value of
+        each item (so `True`, `1` and `1.0` are distinct). Otherwise we receive the full driver
+        config and do not cache. Configs with unhashable values are not cached either.
+
+        :param fn: Function we're decorating
+        :param config: Config to use for collecting nodes
+        :return: Topologically sorted list of pruned nodes
+        """
+        cache_key = None
+        if self.config_required is not None:
+            try:
+                cache_key = frozenset((key, type(value), value) for key, value in config.items())
+            except TypeError:
+                pass
+        if cache_key is not None and cache_key in self._sorted_nodes_cache:
+            return self._sorted_nodes_cache[cache_key]
+        initial_nodes = subdag.collect_nodes(config, self.subdag_functions)
+        transformed_nodes = with_columns._prep_nodes(initial_nodes)
+        self._validate_dataframe_subdag_parameter(transformed_nodes, fn.__qualname__)
+        pruned_nodes = prune_nodes(transformed_nodes, self.select)
+        if len(pruned_nodes) == 0:
+            raise ValueError(
+                f"No nodes found upstream from select columns: {self.select} for function: "
+                f"{fn.__qualname__}"
+            )
+        sorted_initial_nodes = graph_functions.topologically_sort_nodes(pruned_nodes)
+        if cache_key is not None:
+            self._sorted_nodes_cache[cache_key] = sorted_initial_nodes
+        return sorted_initial_nodes
+
     def generate_nodes(self, fn: Callable, config: Dict[str, Any]) -> List[node.Node]:
         """Generates nodes in the with_columns groups. This does the following:
 
@@ -1164,24 +1233,13 @@ class with_columns(fm_base.NodeCreator):
         :return: List of nodes that this function produces
         """
         namespace = fn.__name__ if self.namespace is None else self.namespace
-        initial_nodes = subdag.collect_nodes(config, self.subdag_functions)
-        transformed_nodes = with_columns._prep_nodes(initial_nodes)
-        self._validate_dataframe_subdag_parameter(transformed_nodes, fn.__qualname__)
-        pruned_nodes = prune_nodes(transformed_nodes, self.select)
-        if len(pruned_nodes) == 0:
-            raise ValueError(
-                f"No nodes found upstream from select columns: {self.select} for function: "
-                f"{fn.__qualname__}"
-            )
-        sorted_initial_nodes = graph_functions.topologically_sort_nodes(pruned_nodes)
+        sorted_initial_nodes = self._resolve_sorted_nodes(fn, config)
         output_nodes = []
-        inject_parameter = _derive_first_dataframe_parameter_from_fn(fn)
+        inject_parameter = self._derive_inject_parameter(fn)
         current_dataframe_node = inject_parameter
         # Columns that it is dependent on could be from the group of transforms created
-        columns_produced_within_mapgroup = {node_.name for node_ in pruned_nodes}
-        columns_passed_in_from_dataframe = (
-            set(self.initial_schema) if self.initial_schema is not None else []
-        )
+        columns_produced_within_mapgroup = {node_.name for node_ in sorted_initial_nodes}
+        columns_passed_in_from_dataframe = self._initial_schema_set
         drop_list = []
         # Or from the dataframe passed in...
         for node_ in sorted_initial_nodes:
@@ -1249,10 +1307,23 @@ class with_columns(fm_base.NodeCreator):
         final_node = node.Node.from_fn(fn).reassign_inputs(
             {inject_parameter: assign_namespace(current_dataframe_node, namespace)}
         )
-        return output_nodes + [final_node]
+        # add_namespace returns a fresh list, so we can append in place
+        output_nodes.append(final_node)
+        return output_nodes
+
+    def _derive_inject_parameter(self, fn: Callable) -> str:
+        """Derives the dataframe parameter to inject into, caching it on the decorator
+        so we only inspect the signature of the decorated function once.
+
+        :param fn: Function we're decorating
+        :return: The name of the first (dataframe) parameter of the function
+        """
+        if fn not in self._inject_parameters:
+            self._inject_parameters[fn] = _derive_first_dataframe_parameter_from_fn(fn)
+        return self._inject_parameters[fn]
 
     def validate(self, fn: Callable):
-        _derive_first_dataframe_parameter_from_fn(fn)
+        self._derive_inject_parameter(fn)
 
 
 class select(with_columns):
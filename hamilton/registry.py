@@ -15,6 +15,9 @@ DF_TYPE_AND_COLUMN_TYPES: Dict[str, Dict[str, Type]] = {}
 COLUMN_TYPE = "column_type"
 DATAFRAME_TYPE = "dataframe_type"
 
+# Cache of dataframe type -> column type lookups. Cleared whenever types are (re)registered.
+_COLUMN_TYPE_CACHE: Dict[Type, Type] = {}
+
 
 def register_types(extension_name: str, dataframe_type: Type, column_type: Optional[Type]):
     """Registers the dataframe and column types for the extension. Note that column types are optional
@@ -30,6 +33,7 @@ def register_types(extension_name: str, dataframe_type: Type, column_type: Optio
     if column_type is not None:
         output[COLUMN_TYPE] = column_type
     DF_TYPE_AND_COLUMN_TYPES[extension_name] = output
+    _COLUMN_TYPE_CACHE.clear()
 
 
 @functools.singledispatch
@@ -60,6 +64,27 @@ def fill_with_scalar(df: Any, column_name: str, scalar_value: Any) -> Any:
 def get_column_type_from_df_type(dataframe_type: Type) -> Type:
     """Function to cycle through the registered extensions and return the column type for the dataframe type.
 
+    :param dataframe_type: the dataframe type to find the column type for.
+    :return: the column type.
+    :raises: NotImplementedError if we don't know what the column type is.
+    """
+    cacheable = True
+    try:
+        return _COLUMN_TYPE_CACHE[dataframe_type]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable type (E.G. Annotated with unhashable metadata) -- just don't cache it
+        cacheable = False
+    column_type = _find_column_type(dataframe_type)
+    if cacheable:
+        _COLUMN_TYPE_CACHE[dataframe_type] = column_type
+    return column_type
+
+
+def _find_column_type(dataframe_type: Type) -> Type:
+    """Cycles through the registered extensions to find the column type. See get_column_type_from_df_type.
+
     :param dataframe_type: the dataframe type to find the column type for.
     :return: the column type.
     :raises: NotImplementedError if we don't know what the column type is.
@@ -691,6 +691,71 @@ def test_with_columns_generate_nodes_specify_namespace():
     assert set(nodes_by_names.keys()) == {"foo.a", "foo.b", "foo.c", "df_as_pandas"}
 
 
+@pytest.fixture
+def collect_nodes_calls(monkeypatch):
+    """Records the config of every call to subdag.collect_nodes."""
+    collect_nodes = h_spark.subdag.collect_nodes
+    calls = []
+
+    def counting_collect_nodes(config, subdag_functions):
+        calls.append(config)
+        return collect_nodes(config, subdag_functions)
+
+    monkeypatch.setattr(h_spark.subdag, "collect_nodes", counting_collect_nodes)
+    return calls
+
+
+def _cache_test_with_columns(config_required):
+    return h_spark.with_columns(
+        basic_spark_dag.a,
+        basic_spark_dag.b,
+        basic_spark_dag.c,
+        columns_to_pass=["a_raw", "b_raw", "c_raw", "key"],
+        config_required=config_required,
+    )
+
+
+def _cache_test_df_as_pandas(df: DataFrame) -> pd.DataFrame:
+    return df.toPandas()
+
+
+@pytest.mark.parametrize(
+    "config_required,expected_calls",
+    [
+        # cached per config when config_required is specified
+        (["foo"], [1, 1, 2, 3, 4, 5, 6]),
+        # never cached when we get the full driver config
+        (None, [1, 2, 3, 4, 5, 6, 7]),
+    ],
+)
+def test_with_columns_generate_nodes_caches_subdag_nodes(
+    collect_nodes_calls, config_required, expected_calls
+):
+    dec = _cache_test_with_columns(config_required)
+    configs = [
+        {"foo": "bar"},
+        {"foo": "bar"},
+        {"foo": "baz"},
+        # equal values of different types are distinct cache entries
+        {"foo": 1},
+        {"foo": True},
+        # unhashable config values are not cached
+        {"foo": ["bar"]},
+        {"foo": ["bar"]},
+    ]
+    calls_after_each = []
+    for config in configs:
+        nodes = dec.generate_nodes(_cache_test_df_as_pandas, config)
+        assert {n.name for n in nodes} == {
+            "_cache_test_df_as_pandas.a",
+            "_cache_test_df_as_pandas.b",
+            "_cache_test_df_as_pandas.c",
+            "_cache_test_df_as_pandas",
+        }
+        calls_after_each.append(len(collect_nodes_calls))
+    assert calls_after_each == expected_calls
+
+
 def test__format_pandas_udf():
     assert (
         h_spark._format_pandas_udf("foo", ["a", "b"]).strip()
@@ -0,0 +1,57 @@
+import pytest
+
+from hamilton import registry
+
+
+class CustomDataFrame:
+    pass
+
+
+class CustomColumn:
+    pass
+
+
+@pytest.fixture
+def custom_types():
+    """Registers a local dataframe/column pair, restoring the registry state afterwards."""
+    original_types = dict(registry.DF_TYPE_AND_COLUMN_TYPES)
+    original_cache = dict(registry._COLUMN_TYPE_CACHE)
+    registry.register_types("test_custom", CustomDataFrame, CustomColumn)
+    yield
+    registry.DF_TYPE_AND_COLUMN_TYPES.clear()
+    registry.DF_TYPE_AND_COLUMN_TYPES.update(original_types)
+    registry._COLUMN_TYPE_CACHE.clear()
+    registry._COLUMN_TYPE_CACHE.update(original_cache)
+
+
+def test_get_column_type_from_df_type_is_cached(custom_types):
+    assert registry.get_column_type_from_df_type(CustomDataFrame) == CustomColumn
+    assert registry._COLUMN_TYPE_CACHE[CustomDataFrame] == CustomColumn
+    # second lookup is served from the cache
+    assert registry.get_column_type_from_df_type(CustomDataFrame) == CustomColumn
+
+
+def test_get_column_type_from_df_type_unknown_type_not_cached(custom_types):
+    class UnknownDataFrame:
+        pass
+
+    with pytest.raises(NotImplementedError) as e:
+        registry.get_column_type_from_df_type(UnknownDataFrame)
+    assert e.value.__context__ is None
+    assert UnknownDataFrame not in registry._COLUMN_TYPE_CACHE
+
+
+def test_get_column_type_from_df_type_unhashable_type_not_cached(custom_types):
+    # stands in for e.g. an Annotated type with unhashable metadata
+    unhashable_type = [CustomDataFrame]
+    with pytest.raises(NotImplementedError) as e:
+        registry.get_column_type_from_df_type(unhashable_type)
+    # the lookup happens outside of the except block, so no chained TypeError
+    assert e.value.__context__ is None
+
+
+def test_register_types_clears_column_type_cache(custom_types):
+    registry.get_column_type_from_df_type(CustomDataFrame)
+    registry.register_types("test_custom", CustomDataFrame, CustomColumn)
+    assert registry._COLUMN_TYPE_CACHE == {}
+    assert registry.get_column_type_from_df_type(CustomDataFrame) == CustomColumn